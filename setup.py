@@ -20,7 +20,7 @@
 
 import os
 import sys
-from setuptools import setup, find_packages
+from setuptools import setup
 from codecs import open
 
 from tripoli.tripoli import __version__
@@ -37,7 +37,7 @@ with open('HISTORY.rst', 'r', 'utf-8') as f:
 
 setup(
     name='tripoli',
-    packages=find_packages(),
+    packages=['tripoli', 'tripoli.resource_validators'],
     version=__version__,
     license='https://opensource.org/licenses/MIT',
     description='IIIF document validation.',
@@ -49,6 +49,7 @@ setup(
     keywords=['validator', 'IIIF'],
     python_requires='>=3.5',
     install_requires=['defusedxml'],
+    extras_require={'lxml': ['lxml']},
     classifiers=[
         "License :: OSI Approved :: MIT License",
         "Development Status :: 5 - Production/Stable",
@@ -1,6 +1,12 @@
+import gc
+import weakref
+from collections import OrderedDict
+
+import defusedxml.ElementTree as ET
+
 from .validator_testing_tools import ValidatorTestingTools
 from tripoli import IIIFValidator
-from tripoli.resource_validators.base_validator import BaseValidator
+from tripoli.resource_validators.base_validator import BaseValidator, _parse_html
 from tripoli.validator_logging import ValidatorLogError, ValidatorLogWarning, ValidatorLog, Path
 from tripoli.exceptions import FailFastException
 
@@ -15,6 +21,28 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
         iv.debug = False
         self.test_subject = BaseValidator(iv)
 
+    def test_compare_dicts_schema_entry_replaced(self):
+        man = {"field_1": "value"}
+        schema = {"field_1": self.fake_valid}
+        self.test_subject._compare_dicts(schema, man)
+        self.assertFalse(self.has_errors())
+
+        # Test that replacing a schema entry in place takes effect.
+        schema["field_1"] = self.fake_invalid
+        self.test_subject._compare_dicts(schema, man)
+        self.assertTrue(self.has_errors())
+
+    def test_compare_dicts_bound_schema(self):
+        man = {"label": "value"}
+        self.test_subject.bound_field = self.fake_change
+        schema = self.test_subject._bind_schema((("label", "bound_field"),))
+        val = self.test_subject._compare_dicts(schema, man)
+        self.assertEqual(val, {"label": "valuechanged stuff"})
+
+        # Test that bound schemas cannot be changed from under their compiled function.
+        with self.assertRaises(TypeError):
+            schema["label"] = self.fake_valid
+
     def test_compare_dicts(self):
         man = {"field_1": "value", "field_3": "value"}
 
@@ -79,6 +107,35 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
         self.test_subject._check_required_fields("test", {"test_field": "value"}, ["test_field"])
         self.assertFalse(self.has_errors())
 
+    def test_missing_required_fields_logged_in_order(self):
+        self.test_subject._IIIFValidator.fail_fast = True
+        with self.assertRaises(FailFastException):
+            self.test_subject._check_required_fields("test", {}, ['@id', '@context'])
+        self.assertEqual([err.path[-1] for err in self.test_subject.errors], ['@id'])
+
+    def test_missing_required_fields_report_other_constraints(self):
+        self.test_subject.REQUIRED_FIELDS = {"test_field"}
+        self.test_subject.KNOWN_FIELDS = {"test_field"}
+
+        # Test that unknown fields are still reported when a required field is missing.
+        self.test_subject._check_all_key_constraints("test", {"other_field": "value"})
+        self.assertTrue(self.has_errors())
+        self.assertTrue(self.has_warnings())
+        self.clear_errors_and_warnings()
+
+        # Test that unknown fields are reported once required fields are present.
+        self.test_subject._check_all_key_constraints("test", {"test_field": "value", "other_field": "value"})
+        self.assertFalse(self.has_errors())
+        self.assertTrue(self.has_warnings())
+
+    def test_key_constraints_logged_in_document_order(self):
+        keys = ["key_{}".format(i) for i in reversed(range(20))]
+        self.test_subject.FORBIDDEN_FIELDS = frozenset(keys[:10])
+        self.test_subject.KNOWN_FIELDS = frozenset(keys[:10])
+        self.test_subject._check_all_key_constraints("test", OrderedDict.fromkeys(keys, "value"))
+        self.assertEqual([err.path[-1] for err in self.test_subject.errors], keys[:10])
+        self.assertEqual([warn.path[-1] for warn in self.test_subject.warnings], keys[10:])
+
     def test_str_or_val_lang_type(self):
         """Allows stings, lists of strings, val/lang dicts, and lists of val/lang dicts"""
         valid_inputs = ['hello', ['hello', 'there'], {'@language': 'en', '@value': 'hello'},
@@ -102,6 +159,13 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
         invalid_inputs = ['hello', ['hello', 'everyone']]
         self.assert_errors_with_inputs(self.test_subject._repeatable_uri_type, invalid_inputs)
 
+    def test_repeated_types_return_uncorrected_lists(self):
+        uris = ['http://google.com', {'@id': 'http://bing.com'}]
+        self.assertIs(self.test_subject._repeatable_uri_type('unknown_field', uris), uris)
+        labels = ['hello', {'@value': 'there', '@language': 'en'}]
+        self.assertIs(self.test_subject._str_or_val_lang_type('unknown_field', labels), labels)
+        self.assertFalse(self.has_errors())
+
     def test_http_uri_type(self):
         """Allow a single uri in either format that must be http/s"""
         valid_inputs = ['http://google.ca', {'@id': 'https://bing.com'}]
@@ -112,12 +176,25 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
 
     def test_uri_type(self):
         """Allow a single uri in either format."""
-        valid_inputs = ['http://google.ca', 'ftp://google.ca', {'@id': 'http://google.ca'}]
+        valid_inputs = ['http://google.ca', 'ftp://google.ca', {'@id': 'http://google.ca'},
+                        ' http://google.ca', 'http://google\n.ca']
         self.assert_no_errors_with_inputs(self.test_subject._uri_type, valid_inputs)
 
         invalid_inputs = [{'key': 'http:google.ca'}, 'hello', ['http://google.ca']]
         self.assert_errors_with_inputs(self.test_subject._uri_type, invalid_inputs)
 
+    def test_id_field_uuid(self):
+        valid_inputs = ['urn:uuid:12345678-1234-5678-1234-567812345678',
+                        'urn:uuid:{12345678123456781234567812345678}']
+        self.assert_no_errors_with_inputs(self.test_subject.id_field, valid_inputs)
+        invalid_inputs = ['urn:uuid:1234', 'urn:uuid:12345678-1234-5678-1234-56781234567g']
+        self.assert_errors_with_inputs(self.test_subject.id_field, invalid_inputs)
+
+    def test_int_type(self):
+        """Allow ints only."""
+        self.assert_no_errors_with_inputs(self.test_subject._int_type, [0, 400])
+        self.assert_errors_with_inputs(self.test_subject._int_type, ['400', 4.5, None, True])
+
     def test_metadata_field(self):
         """Allow properly formatted metadata as specified by the presentation api."""
         valid_inputs = [
@@ -166,6 +243,12 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
         self.assert_no_errors_with_inputs(self.test_subject.viewing_dir_field, ["paged", "non-paged"])
         self.assert_errors_with_inputs(self.test_subject.viewing_dir_field, ["error"])
 
+    def test_view_dir_hint_field_unhashable(self):
+        self.test_subject.VIEW_HINTS = frozenset({"paged", "non-paged"})
+        self.test_subject.VIEW_DIRS = frozenset({"left-to-right"})
+        self.assert_errors_with_inputs(self.test_subject.viewing_hint_field, [["paged"], {"paged": 1}])
+        self.assert_errors_with_inputs(self.test_subject.viewing_dir_field, [["left-to-right"], {"a": 1}])
+
     def test_html_validation(self):
         # Valid (path, field, html-value) tuples
         valid_inputs = {
@@ -186,6 +269,8 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
             (Path(tuple()), 'description', "<script>Nasty scripting</script>"),
             (Path(tuple()), 'description', "<a target='something'>Bad attribute</a>"),
             (Path(tuple()), 'description', "this is <a>badly formatted.</a>"),
+            (Path(tuple()), 'description', "<p>Hidden <!-- comment --></p>"),
+            (Path(tuple()), 'description', "<p><![CDATA[raw text]]></p>"),
         }
 
         for p, f, v in invalid_inputs:
@@ -194,6 +279,43 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
             self.assertTrue(self.has_errors(), (p,f,v))
             self.clear_errors_and_warnings()
 
+    def test_html_allowed_fields_override(self):
+        self.test_subject.HTML_ALLOWED_FIELDS = [('label',)]
+        self.test_subject._check_html('label', "<p>Allowed</p>")
+        self.assertFalse(self.has_warnings_or_errors())
+        self.test_subject._check_html('description', "<p>Not allowed</p>")
+        self.assertTrue(self.has_errors())
+
+    def test_html_deeply_nested(self):
+        self.test_subject._path = Path(tuple())
+        self.test_subject._check_html('description', '<p>' + '<span>' * 300 + 'x' + '</span>' * 300 + '</p>')
+        self.assertFalse(self.has_warnings_or_errors())
+
+    def test_html_parsers_agree(self):
+        # The verdict must not depend on whether lxml is installed.
+        values = ['<p>x</p>', '<p>x', '<p>&nbsp;</p>', '<!DOCTYPE p><p>x</p>',
+                  '<!DOCTYPE p SYSTEM "http://example.com/p.dtd"><p>x</p>',
+                  '<p>' + '<span>' * 300 + 'x' + '</span>' * 300 + '</p>']
+        for value in values:
+            outcomes = []
+            for parse in (_parse_html, ET.fromstring):
+                try:
+                    outcomes.append(parse(value).tag)
+                except ET.ParseError:
+                    outcomes.append(None)
+            self.assertEqual(outcomes[0], outcomes[1], value)
+
+        self.test_subject._path = Path(('metadata',))
+        self.test_subject._check_html('value', '<!DOCTYPE p><p>x</p>')
+        self.assertFalse(self.has_warnings_or_errors())
+
+    def test_html_unclosed_tag(self):
+        # Many attributes with no closing '>' is not a tag, and must not
+        # send the tag regex into exponential backtracking.
+        self.test_subject._path = Path(('metadata',))
+        self.test_subject._check_html('value', '<a' + ' b="x"' * 40)
+        self.assertFalse(self.has_warnings_or_errors())
+
     def test_mute_error(self):
         # Test error is caught.
         val, err = self.test_subject.mute_errors(self.fake_invalid, "value")
@@ -291,6 +413,21 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
         x = ValidatorLogError('test error', ('fake field',))
         self.assertEqual(repr(x), "ValidatorLogError('test error',  @ data['fake field'])")
 
+    def test_validator_log_entry_equality(self):
+        a = ValidatorLogError('test error', ('canvases', 0, 'fake field'))
+        b = ValidatorLogError('test error', ('canvases', 1, 'fake field'))
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, ValidatorLogWarning('test error', ('canvases', 0, 'fake field')))
+        self.assertNotEqual(a, ValidatorLogError('other error', ('canvases', 0, 'fake field')))
+
+    def test_validator_log_entries_have_no_dict(self):
+        for cls in (ValidatorLogWarning, ValidatorLogError):
+            x = cls('test error', ('fake field',))
+            self.assertFalse(hasattr(x, '__dict__'))
+            with self.assertRaises(AttributeError):
+                x.extra = 1
+
     # NB: This should be tested with an actual traceback scenario.
     def test_validator_log_print_trace(self):
         x = ValidatorLogError('test error', ('fake field',))
@@ -307,4 +444,24 @@ class TestBaseValidatorMixin(ValidatorTestingTools):
         v.add(e)
         self.assertEqual(len(v._entries), 1)
 
-
+    def test_validator_unique_logging_keeps_first_entry_in_order(self):
+        v = ValidatorLog(unique_logging=True)
+        a = ValidatorLogError('test error', ('fake field', 0))
+        b = ValidatorLogError('other error', ('fake field',))
+        v.add(a)
+        v.add(b)
+        v.add(ValidatorLogError('test error', ('fake field', 1)))
+        self.assertEqual(len(v), 2)
+        self.assertEqual([e.path for e in v], [a.path, b.path])
+
+    def test_validator_log_freed_without_gc(self):
+        for unique_logging in (True, False):
+            v = ValidatorLog(unique_logging)
+            v.add(ValidatorLogError('test error', ('fake field',)))
+            ref = weakref.ref(v)
+            gc.disable()
+            try:
+                del v
+                self.assertIsNone(ref())
+            finally:
+                gc.enable()
@@ -1,7 +1,6 @@
-import json
 import os
 
-from .validator_testing_tools import ValidatorTestingTools
+from .validator_testing_tools import ValidatorTestingTools, load_fixture
 from tripoli import IIIFValidator
 
 
@@ -13,8 +12,7 @@ class TestErrorCollection(ValidatorTestingTools):
         self.base_dir = os.path.dirname(os.path.realpath(__file__))
 
     def test_error_collection(self):
-        with open(os.path.join(self.base_dir, 'fixtures/error_collection.json')) as f:
-            collection = json.load(f)
+        collection = load_fixture('error_collection.json')
 
         for m in collection['manifests']:
             self.test_subject.validate(m['manifest'])
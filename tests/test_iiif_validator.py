@@ -1,11 +1,6 @@
-try:
-    import ujson as json
-except ImportError:
-    import json
-
 import os
 
-from .validator_testing_tools import ValidatorTestingTools
+from .validator_testing_tools import ValidatorTestingTools, load_fixture
 from tripoli import IIIFValidator
 
 
@@ -20,18 +15,13 @@ class TestIIIFValidator(ValidatorTestingTools):
 
         self.base_dir = os.path.dirname(os.path.realpath(__file__))
 
-        with open(os.path.join(self.base_dir, 'fixtures/valid_manifest')) as f:
-            self.valid_manifest = json.load(f)
-
-        with open(os.path.join(self.base_dir, 'fixtures/error_collection.json')) as f:
-            self.error_collection = json.load(f)
-            self.man_with_warnings_and_errors = self.error_collection['manifests'][-1]['manifest']
+        self.valid_manifest = load_fixture('valid_manifest')
+        self.error_collection = load_fixture('error_collection.json')
+        self.man_with_warnings_and_errors = self.error_collection['manifests'][-1]['manifest']
 
     def test_valid_manifest(self):
         """Test that a valid manifest raises no errors."""
-        with open(os.path.join(self.base_dir, 'fixtures/valid_manifest')) as f:
-            man = json.load(f)
-            self.test_subject.validate(man)
+        self.test_subject.validate(load_fixture('valid_manifest'))
         self.assertFalse(self.has_errors())
 
     def test_text_manifest(self):
@@ -40,6 +30,21 @@ class TestIIIFValidator(ValidatorTestingTools):
             self.test_subject.validate(f.read())
         self.assertFalse(self.has_errors())
 
+    def test_sub_validator_logs_kept(self):
+        """Test that each validator keeps the log of its last validation."""
+        self.test_subject.validate(self.man_with_warnings_and_errors)
+        self.assertTrue(self.test_subject.errors)
+        self.assertEqual(self.test_subject.ManifestValidator.errors, self.test_subject.errors)
+        self.assertEqual(self.test_subject.ManifestValidator.warnings, self.test_subject.warnings)
+
+    def test_text_manifest_stdlib_json(self):
+        """Test that text the standard json module accepts still parses."""
+        with open(os.path.join(self.base_dir, 'fixtures/valid_manifest')) as f:
+            text = f.read()
+        text = text.replace('{', '{"navDate": NaN, ', 1)
+        self.test_subject.validate(text)
+        self.assertFalse(any("Could not parse json" in str(err) for err in self.test_subject.errors))
+
     def test_debug_setting(self):
         """Test that the debug setting works."""
         iv = IIIFValidator(debug=True)
@@ -1,8 +1,38 @@
+import functools
+import os
 import unittest
 import inspect
 
+from tripoli.tripoli import json_loads
 from tripoli.validator_logging import ValidatorLog
 
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+
+
+@functools.lru_cache(maxsize=None)
+def load_fixture(name):
+    """Parse a json fixture, once per test run.
+
+    The parsed document is shared between tests, so it must not be
+    modified in place.
+    """
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def _takes_field(fn):
+    """Return true if fn takes a ``field`` argument, inspecting each function once."""
+    return "field" in inspect.signature(fn).parameters
+
+
+def _call_with_input(fn, arg):
+    # Key the cache on the underlying function, as bound methods are
+    # rebuilt on every attribute access and would pin each test subject.
+    if _takes_field(getattr(fn, '__func__', fn)):
+        return fn('unknown_field', arg)
+    return fn(arg)
+
 
 class ValidatorTestingTools(unittest.TestCase):
 
@@ -38,19 +68,24 @@ class ValidatorTestingTools(unittest.TestCase):
 
     def assert_no_errors_with_inputs(self, fn, inputs):
         """Run validation fn on each input, asserting no error is logged."""
-        args = inspect.signature(fn).parameters
-        for arg in inputs:
-            val = fn('unknown_field', arg) if "field" in args else fn(arg)
-            try:
+        # Nothing is logged while inputs are valid, so the log only needs
+        # clearing once, after the last input (or the first failure).
+        try:
+            for arg in inputs:
+                val = _call_with_input(fn, arg)
                 self.assertFalse(self.has_errors(), "{} is not valid input".format(arg))
                 self.assertEqual(arg, val)
-            finally:
-                self.clear_errors()
+        finally:
+            self.clear_errors()
 
     def assert_errors_with_inputs(self, fn, inputs):
-        args = inspect.signature(fn).parameters
+        """Run validation fn on each input, asserting an error is logged.
+
+        The log is cleared after every input, as unique logging would
+        otherwise hide an input repeating an earlier input's error.
+        """
         for arg in inputs:
-            val = fn('unknown_field', arg) if "field" in args else fn(arg)
+            val = _call_with_input(fn, arg)
             try:
                 self.assertTrue(self.has_errors(), "{} is valid input".format(arg))
                 self.assertEqual(arg, val)
@@ -18,29 +18,31 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from collections import OrderedDict
-
 from .base_validator import BaseValidator
 
 
 class AnnotationValidator(BaseValidator):
     KNOWN_FIELDS = BaseValidator.COMMON_FIELDS | {"motivation", "resource", "on", "@context"}
-    FORBIDDEN_FIELDS = {"format", "height", "width", "viewingDirection", "navDate", "startCanvas", "first",
-                        "last", "total", "next", "prev", "startIndex", "collections", "manifests", "members",
-                        "sequences", "structures", "canvases", "resources", "otherContent", "images", "ranges"}
-    REQUIRED_FIELDS = {"@type", "on", "motivation", "resource"}
+    FORBIDDEN_FIELDS = frozenset({"format", "height", "width", "viewingDirection", "navDate", "startCanvas",
+                                  "first", "last", "total", "next", "prev", "startIndex", "collections",
+                                  "manifests", "members", "sequences", "structures", "canvases", "resources",
+                                  "otherContent", "images", "ranges"})
+    REQUIRED_FIELDS = frozenset({"@type", "on", "motivation", "resource"})
+
+    # (key, method name) pairs checked on each annotation, in order.
+    _IMAGE_SCHEMA = (
+        ("@id", "id_field"),
+        ("@type", "type_field"),
+        ("motivation", "motivation_field"),
+        ("on", "on_field"),
+        ("height", "height_field"),
+        ("width", "width_field"),
+        ("resource", "resource_field")
+    )
 
     def __init__(self, iiif_validator):
         super().__init__(iiif_validator)
-        self.ImageSchema = OrderedDict((
-            ("@id", self.id_field),
-            ('@type', self.type_field),
-            ('motivation', self.motivation_field),
-            ("on", self.on_field),
-            ('height', self.height_field),
-            ('width', self.width_field),
-            ('resource', self.resource_field)
-        ))
+        self.ImageSchema = self._bind_schema(self._IMAGE_SCHEMA)
 
         self.canvas_uri = None
         self.setup()
@@ -76,5 +78,5 @@ class AnnotationValidator(BaseValidator):
 
         Calls a sub-validation procedure handled by the :class:`ImageContentValidator`.
         """
-        path = self._path + ("resource", )
+        path = self._path + "resource"
         return self._sub_validate(self.ImageContentValidator, value, path)
@@ -21,19 +21,209 @@
 import contextlib
 import functools
 import traceback
-import urllib.parse
-import copy
-import uuid
 import re
+import sys
+import types
+from collections import OrderedDict
 
 import defusedxml.ElementTree as ET
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 from ..mixins import LinkedValidatorMixin, SubValidationMixin
 from ..validator_logging import ValidatorLogError, ValidatorLogWarning, Path, ValidatorLog
 from ..exceptions import FailFastException
 
+if lxml_etree is not None:
+    def _parse_html(value):
+        """Parse an HTML fragment into an element using lxml.
+
+        libxml2 parses fragments in C. Entities are never expanded and no
+        DTDs or network resources are loaded. Parsers are not safe to
+        share between threads, so one is built per call.
+        """
+        parser = lxml_etree.XMLParser(resolve_entities=False, load_dtd=False, no_network=True,
+                                      remove_comments=True, remove_pis=True, huge_tree=True)
+        try:
+            elem = lxml_etree.fromstring(value.encode('utf-8'), parser)
+        except lxml_etree.XMLSyntaxError:
+            elem = None
+        if elem is None or elem.getroottree().docinfo.internalDTD is not None:
+            # libxml2 has limits expat does not (such as nesting depth) and
+            # treats DTDs differently, so defusedxml decides these fragments.
+            return ET.fromstring(value)
+        return elem
+else:
+    _parse_html = ET.fromstring
+
+
+def _extract_stack(frame):
+    """Equivalent to traceback.extract_stack(frame), without reading source.
+
+    Source lines are looked up lazily by each FrameSummary, so they are
+    only read from disk if the trace is actually printed.
+    """
+    stack = traceback.StackSummary.extract(traceback.walk_stack(frame), lookup_lines=False)
+    stack.reverse()
+    return stack
+
+
+def _log_warning(self, field, msg):
+    """Record a warning on self; the body of BaseValidator.log_warning."""
+    if self.collect_warnings:
+        # Frame 2 is the caller of BaseValidator.log_warning.
+        tb = _extract_stack(sys._getframe(2)) if self.debug else None
+        warn = ValidatorLogWarning(msg, self._path + field, tb)
+        if self.verbose:
+            self._IIIFValidator.logger.warning(str(warn))
+        self._warnings.add(warn)
+
+
+def _log_error(self, field, msg):
+    """Record an error on self; the body of BaseValidator.log_error."""
+    if self.collect_errors:
+        tb = _extract_stack(sys._getframe(2)) if self.debug else None
+        err = ValidatorLogError(msg, self._path + field, tb)
+        if self.verbose:
+            self._IIIFValidator.logger.error(str(err))
+        self._errors.add(err)
+    if self.fail_fast:
+        raise FailFastException
+
+
+# Stack of the error sets being collected by (possibly nested) calls
+# to BaseValidator.mute_errors.
+_muted_errors = []
+
+
+def _log_muted_error(self, field, msg):
+    """Stand-in for _log_error while errors are muted."""
+    tb = _extract_stack(sys._getframe(2)) if self.debug else None
+    _muted_errors[-1].add(ValidatorLogError(msg, self._path + field, tb))
+
+
+# The functions BaseValidator.log_error and log_warning dispatch to. The
+# coercion decorators and mute_errors swap these for the duration of a
+# call, which affects every validator (including sub-validations) just as
+# patching the methods would, without writing to the class and so
+# invalidating the method caches of all of its subclasses.
+_log_dispatch = {"error": _log_error, "warning": _log_warning}
+
+
+# Shared fallback for lookups which would otherwise allocate an empty set.
+_EMPTY_SET = frozenset()
+
+# Paths are immutable, so every validation from the root can share one.
+_ROOT_PATH = Path()
+
+
+def _frozen_keys(keys):
+    """Return keys as a frozenset of interned strings."""
+    return frozenset(sys.intern(key) for key in keys)
+
+
+# Leading characters urlparse strips from a URL, and the characters it
+# removes from anywhere in one.
+_C0_CONTROL_OR_SPACE = ''.join(chr(i) for i in range(0x21))
+_URL_CHARS_TO_REMOVE = str.maketrans('', '', '\t\r\n')
+
+
+# Maps a tuple of schema keys to a factory which, given the schema's
+# functions, returns a function applying them to a dict. Each factory is
+# generated once per distinct schema shape and shared by all validators.
+_SCHEMA_FACTORIES = {}
+
+
+def _build_schema_factory(keys):
+    """Generate and compile a factory for straight-line schema functions.
+
+    The generated function is equivalent to the loop previously found in
+    ``BaseValidator._compare_dicts``, with one ``if key in value`` check
+    emitted per key instead of iterating over the schema at runtime. The
+    dict is only copied once some function returns a new object, so
+    resources which need no corrections are returned as they are.
+    """
+    fn_names = ["f{}".format(i) for i in range(len(keys))]
+    lines = ["def _factory({}):".format(", ".join(fn_names)),
+             "    def _compare(value):",
+             "        corrected = value"]
+    for key, fn_name in zip(keys, fn_names):
+        lines.append("        if {!r} in value:".format(key))
+        lines.append("            old = value[{!r}]".format(key))
+        lines.append("            new = {}(old)".format(fn_name))
+        lines.append("            if new is not old:")
+        lines.append("                if corrected is value:")
+        lines.append("                    corrected = value.copy()")
+        lines.append("                corrected[{!r}] = new".format(key))
+    lines.append("        return corrected")
+    lines.append("    return _compare")
+    namespace = {}
+    exec(compile("\n".join(lines), "<schema {!r}>".format(keys), "exec"), namespace)
+    return namespace["_factory"]
+
+
+def _key_violations(keys, required, forbidden, known):
+    """Compare a resource's keys against its key constraints.
+
+    :param keys: The keys of the resource.
+    :param required (set): Required key names.
+    :param forbidden (set): Forbidden key names.
+    :param known (set): Known key names, or None to skip checking for
+        unknown keys.
+    :return (tuple): The forbidden keys present, the required keys
+        missing (in the order they are required), and the unknown keys
+        present.
+    """
+    unknown = keys - known if known is not None else _EMPTY_SET
+    missing = tuple(key for key in required if key not in keys)
+    return keys & forbidden, missing, unknown
+
+
+# Resources of the same type nearly always share the same few key sets,
+# so the set arithmetic for each (keys, constraints) pair is done once.
+_cached_key_violations = functools.lru_cache(maxsize=1024)(_key_violations)
+
+
+@functools.lru_cache(maxsize=256)
+def _html_allowed(allowed_fields, no_index_path):
+    """Return True if no_index_path ends with any of allowed_fields.
+
+    Only a few distinct paths ever hold html, so each is checked once.
+
+    :param allowed_fields (frozenset): Allowed path suffixes, as tuples.
+    :param no_index_path (tuple): The path to check, without indices.
+    """
+    lengths = {len(suffix) for suffix in allowed_fields}
+    return any(no_index_path[-n:] in allowed_fields for n in lengths)
+
+
+class _ValidatorMeta(type):
+    """Freeze the key constraints and allowed values of each validator as it is defined.
+
+    Subclasses may declare the *_FIELDS constraints, VIEW_HINTS,
+    VIEW_DIRS and HTML_ALLOWED_FIELDS as any iterable; converting
+    them once here keeps the set operations and membership tests
+    made per resource from re-hashing them or scanning lists. Key
+    names are interned like the segments of a Path.
+
+    (A metaclass, as __init_subclass__ needs Python 3.6.)
+    """
 
-class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls.KNOWN_FIELDS = _frozen_keys(cls.KNOWN_FIELDS)
+        cls.FORBIDDEN_FIELDS = _frozen_keys(cls.FORBIDDEN_FIELDS)
+        cls.REQUIRED_FIELDS = _frozen_keys(cls.REQUIRED_FIELDS)
+        cls.RECOMMENDED_FIELDS = _frozen_keys(cls.RECOMMENDED_FIELDS)
+        cls.VIEW_HINTS = frozenset(cls.VIEW_HINTS)
+        cls.VIEW_DIRS = frozenset(cls.VIEW_DIRS)
+        cls.HTML_ALLOWED_FIELDS = frozenset(tuple(suffix) for suffix in cls.HTML_ALLOWED_FIELDS)
+
+
+class BaseValidator(LinkedValidatorMixin, SubValidationMixin, metaclass=_ValidatorMeta):
     """Defines basic validation behaviour and expected attributes
     of any IIIF validators that inherit from it."""
 
@@ -46,101 +236,117 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
     # based on key constraints. Each inheritor should define these.
 
     #: The fields which may appear on this resource.
-    KNOWN_FIELDS = set()
+    KNOWN_FIELDS = frozenset()
 
     #: The fields which are forbidden on this resource.
-    FORBIDDEN_FIELDS = set()
+    FORBIDDEN_FIELDS = frozenset()
 
     #: The fields which are required on this resource.
-    REQUIRED_FIELDS = set()
+    REQUIRED_FIELDS = frozenset()
 
     #: The fields which are recommended on this resource.
-    RECOMMENDED_FIELDS = set()
+    RECOMMENDED_FIELDS = frozenset()
 
     # The set of acceptable viewHints on this resource.
-    VIEW_HINTS = set()
+    VIEW_HINTS = frozenset()
 
     # The set of acceptable viewDirections on this resource.
-    VIEW_DIRS = set()
+    VIEW_DIRS = frozenset()
 
     # The set of fields which may appear on _any_ resource.
-    COMMON_FIELDS = {
+    COMMON_FIELDS = _frozen_keys((
         "label", "metadata", "description", "thumbnail", "attribution", "license", "logo",
         "@id", "@type", "viewingHint", "seeAlso", "service", "related", "rendering", "within"
-    }
+    ))
+
+    # The keys which may appear in a value/language pair.
+    _VAL_LANG_KEYS = frozenset({'@value', '@language'})
 
     # The path suffixes which are allowed to contain HTML.
-    HTML_ALLOWED_FIELDS = {('description',), ('attribution',),
-                           ('metadata', 'value'), ('metadata', 'label'),
-                           ('@value',)}
+    HTML_ALLOWED_FIELDS = frozenset({('description',), ('attribution',),
+                                     ('metadata', 'value'), ('metadata', 'label'),
+                                     ('@value',)})
 
     # The attributes allowed for each html field.
     HTML_ALLOWED_ATTRIBUTES = {
-        'a': {'href'},
-        'img': {'src', 'alt'}
+        'a': frozenset({'href'}),
+        'img': frozenset({'src', 'alt'})
     }
 
     # The HTML tags which are allowed to appear in a text field.
-    HTML_ALLOWED_TAGS = {'a', 'b', 'br', 'i', 'img', 'p', 'span'}
+    HTML_ALLOWED_TAGS = frozenset({'a', 'b', 'br', 'i', 'img', 'p', 'span'})
 
     # The HTML tags which are expressly forbidden.
-    HTML_FORBIDDEN_TAGS = {'script', 'style', 'object', 'form', 'input'}
+    HTML_FORBIDDEN_TAGS = frozenset({'script', 'style', 'object', 'form', 'input'})
 
-    # Catch all regex for XML in string.
-    _XML_TAG_REGEX = re.compile(r'<\/?(\w+)((\s+\w+(\s*=\s*(?:\".*?\"|\'.*?\'|[\^\'\">\s]+))?)+\s*|\s*)\/?>', re.DOTALL)
+    # Catch all regex for XML in string. Quoted attribute values end at
+    # their first closing quote and unquoted ones cannot contain spaces,
+    # quotes or '>', so each character can only be matched one way and
+    # unclosed tags fail in linear time rather than by backtracking.
+    _XML_TAG_REGEX = re.compile(r'<\/?\w+(?:\s+\w+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s\'">]+))?)*\s*\/?>')
     _XML_COMMENT_REGEX = re.compile(r'<!--.*?-->', re.DOTALL)
     _XML_CDATA_REGEX = re.compile(r'<!\[CDATA\[.*?\]\]>')
 
+    # The scheme and (optional) non-empty authority of a URI, as they
+    # would be split out by urllib.parse.urlparse.
+    _URI_REGEX = re.compile(r'([A-Za-z][A-Za-z0-9+.\-]*):(//[^/?#])?')
+
+    # The 32 hex digits of a UUID, once braces and hyphens are removed.
+    _UUID_HEX_REGEX = re.compile(r'[0-9A-Fa-f]{32}')
+
+    # (key, method name) pairs checked on every resource, in order.
+    _COMMON_FIELDS_SCHEMA = (
+        ("@id", "id_field"),
+        ("label", "label_field"),
+        ("metadata", "metadata_field"),
+        ("description", "description_field"),
+        ("thumbnail", "thumbnail_field"),
+        ("logo", "logo_field"),
+        ("attribution", "attribution_field"),
+        ("@type", "type_field"),
+        ("license", "license_field"),
+        ("related", "related_field"),
+        ("rendering", "rendering_field"),
+        ("service", "service_field"),
+        ("seeAlso", "seeAlso_field"),
+        ("within", "within_field"),
+        ("viewingHint", "viewing_hint_field")
+    )
+
     def __init__(self, iiif_validator=None):
         LinkedValidatorMixin.__init__(self, iiif_validator=iiif_validator)
         SubValidationMixin.__init__(self)
-        self._path = Path(tuple())
+        self._path = _ROOT_PATH
         self._json = None
         self.corrected_doc = None
 
+        # Maps id(schema) -> (schema, compiled function) for the schemas
+        # built by _bind_schema.
+        self._compiled_schemas = {}
+
         self._LangValPairs = {
             '@language': functools.partial(self._repeatable_string_type, "@language"),
             '@value': functools.partial(self._repeatable_string_type, "@value")
         }
 
-        self._MetadataItemSchema = {
-            'label': functools.partial(self._str_or_val_lang_type, "label"),
-            'value': functools.partial(self._str_or_val_lang_type, "value")
-        }
-
-        self._common_fields_mapping = {
-            "@id": self.id_field,
-            "label": self.label_field,
-            "metadata": self.metadata_field,
-            "description": self.description_field,
-            "thumbnail": self.thumbnail_field,
-            "logo": self.logo_field,
-            "attribution": self.attribution_field,
-            "@type": self.type_field,
-            "license": self.license_field,
-            "related": self.related_field,
-            "rendering": self.rendering_field,
-            "service": self.service_field,
-            "seeAlso": self.seeAlso_field,
-            "within": self.within_field,
-            'viewingHint': self.viewing_hint_field
-        }
+        self._common_fields_mapping = self._bind_schema(self._COMMON_FIELDS_SCHEMA)
 
     @staticmethod
     def errors_to_warnings(fn):
         """Cast any errors to warnings on any ``*_field`` or ``*_type`` function.
 
-        Works by patching the BaseValidator.log_error to refer to
-        BaseValidator.log_warning. These methods should not be
-        overridden in children.
+        Works by pointing BaseValidator.log_error at whatever
+        BaseValidator.log_warning currently logs with. These methods
+        should not be overridden in children.
         """
+        @functools.wraps(fn)
         def coerce_errors(*args, **kwargs):
-            old_log_error = BaseValidator.log_error
+            old_log_error = _log_dispatch["error"]
             try:
-                BaseValidator.log_error = BaseValidator.log_warning
+                _log_dispatch["error"] = _log_dispatch["warning"]
                 val = fn(*args, **kwargs)
             finally:
-                BaseValidator.log_error = old_log_error
+                _log_dispatch["error"] = old_log_error
             return val
 
         return coerce_errors
@@ -149,18 +355,18 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
     def warnings_to_errors(fn):
         """Cast any warnings to errors on any ``*_field`` or ``*_type`` function.
 
-        Works by patching the BaseValidator.log_warning to refer to
-        BaseValidator.log_error. These methods should not be
-        overridden in children.
+        Works by pointing BaseValidator.log_warning at whatever
+        BaseValidator.log_error currently logs with. These methods
+        should not be overridden in children.
         """
-
+        @functools.wraps(fn)
         def coerce_warnings(*args, **kwargs):
-            old_log_warning = BaseValidator.log_warning
+            old_log_warning = _log_dispatch["warning"]
             try:
-                BaseValidator.log_warning = BaseValidator.log_error
+                _log_dispatch["warning"] = _log_dispatch["error"]
                 val = fn(*args, **kwargs)
             finally:
-                BaseValidator.log_warning = old_log_warning
+                _log_dispatch["warning"] = old_log_warning
             return val
 
         return coerce_warnings
@@ -176,10 +382,12 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         """
         old_path = self._path
         try:
-            if isinstance(path, tuple):
-                self._path = Path(path)
-            elif isinstance(path, Path):
+            # Path is itself a tuple, so check for it first to avoid
+            # rebuilding paths which are already Paths.
+            if isinstance(path, Path):
                 self._path = path
+            elif isinstance(path, tuple):
+                self._path = Path(path)
             else:
                 raise ValueError("path must be Path or tuple.")
             yield
@@ -191,31 +399,21 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
 
         The self._errors key will not be changed by using this function.
 
-        Works by patching the BaseValidator.log_error function.
-        BaseValidator.log_error should not be overridden in children.
+        Works by pointing BaseValidator.log_error at a function which
+        collects errors instead. BaseValidator.log_error should not be
+        overridden in children.
         """
         caught_errors = set()
-
-        def patched_log_error(self, field, msg):
-            tb = traceback.extract_stack()[:-1] if self.debug else None
-            caught_errors.add(ValidatorLogError(msg, self._path + (field,), tb))
-
-        old_log_error = BaseValidator.log_error
+        _muted_errors.append(caught_errors)
+        old_log_error = _log_dispatch["error"]
         try:
-            BaseValidator.log_error = patched_log_error
+            _log_dispatch["error"] = _log_muted_error
             val = fn(*args, **kwargs)
         finally:
-            BaseValidator.log_error = old_log_error
+            _log_dispatch["error"] = old_log_error
+            _muted_errors.pop()
         return val, caught_errors
 
-    def _reset(self, path):
-        """Reset the validator to handle a new chunk of data."""
-        self._json = None
-        self.is_valid = None
-        self._errors = ValidatorLog(self.unique_logging)
-        self._warnings = ValidatorLog(self.unique_logging)
-        self._path = path
-
     def setup(self):
         pass
 
@@ -223,11 +421,11 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         """Entry point for callers to validate a chunk of data."""
 
         # Reset the validator object constants.
-        if not path:
-            path = Path(tuple())
-        self._reset(path)
-
+        self._path = path or _ROOT_PATH
         self._json = json_dict
+        self.is_valid = None
+        self._errors = ValidatorLog(self.unique_logging)
+        self._warnings = ValidatorLog(self.unique_logging)
         try:
             val = self._run_validation(**kwargs)
             val = self._check_common_fields(val)
@@ -239,6 +437,20 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
             else:
                 self.is_valid = True
 
+    def _bind_schema(self, spec):
+        """Build and compile a schema from (key, method name) pairs.
+
+        Methods are looked up by name once, so subclasses overriding a
+        ``*_field`` method are picked up by the schema. The schema is
+        compiled here and returned as a read-only mapping, so the compiled
+        function can never fall out of date with it.
+
+        :param spec: An iterable of (key, method name) pairs.
+        """
+        schema = types.MappingProxyType(OrderedDict((key, getattr(self, name)) for key, name in spec))
+        self._compiled_schemas[id(schema)] = (schema, self._compile_schema(schema))
+        return schema
+
     def _compare_dicts(self, schema, value):
         """Compare a schema to a dict.
 
@@ -248,12 +460,36 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
 
         :param schema: A dict where each key maps to a function.
         :param value: A dict to validate against the schema."""
-        corrected = copy.copy(value)
+        compiled = self._compiled_schemas.get(id(schema))
+        if compiled is not None and compiled[0] is schema:
+            return compiled[1](value)
+
+        # Schemas not built by _bind_schema may be changed between calls,
+        # so they are iterated over directly.
+        corrected = value
         for key, fn in schema.items():
             if key in value:
-                corrected[key] = fn(corrected[key])
+                old = value[key]
+                new = fn(old)
+                if new is not old:
+                    if corrected is value:
+                        corrected = value.copy()
+                    corrected[key] = new
         return corrected
 
+    @staticmethod
+    def _compile_schema(schema):
+        """Return a function applying the schema to a dict.
+
+        :param schema: A dict where each key maps to a function.
+        """
+        keys = tuple(schema)
+        factory = _SCHEMA_FACTORIES.get(keys)
+        if factory is None:
+            factory = _build_schema_factory(keys)
+            _SCHEMA_FACTORIES[keys] = factory
+        return factory(*schema.values())
+
     def _run_validation(self, **kwargs):
         """Do the actual action of validation. Called by validate()."""
         raise NotImplemented
@@ -289,12 +525,7 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         :param field: The field the warning was raised on.
         :param msg: The message to associate with the warning.
         """
-        if self.collect_warnings:
-            tb = traceback.extract_stack()[:-1] if self.debug else None
-            warn = ValidatorLogWarning(msg, self._path + (field,), tb)
-            if self.verbose:
-                self._IIIFValidator.logger.warning(str(warn))
-            self._warnings.add(warn)
+        _log_dispatch["warning"](self, field, msg)
 
     def log_error(self, field, msg):
         """Add an error to the validator.
@@ -305,19 +536,50 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         :param field: The field the error was raised on.
         :param msg: The message to associate with the error.
         """
-        if self.collect_errors:
-            tb = traceback.extract_stack()[:-1] if self.debug else None
-            err = ValidatorLogError(msg, self._path + (field,), tb)
-            if self.verbose:
-                self._IIIFValidator.logger.error(str(err))
-            self._errors.add(err)
-        if self.fail_fast:
-            raise FailFastException
+        _log_dispatch["error"](self, field, msg)
 
     def _check_common_fields(self, val):
         """Validate fields that could appear on any resource."""
         return self._compare_dicts(self._common_fields_mapping, val)
 
+    def _validate_field_presence(self, resource, r_dict, required=_EMPTY_SET, forbidden=_EMPTY_SET,
+                                 recommended=_EMPTY_SET, known=None):
+        """Check which keys are present in r_dict against each key constraint.
+
+        The keys of r_dict are read once and compared with set operations.
+        Forbidden keys and missing required keys are logged as errors,
+        missing recommended keys and unknown keys as warnings.
+
+        :param resource (str): The name of the resource represented by r_dict.
+        :param r_dict (dict): The dict to have its keys checked.
+        :param required (set): Required key names for this resource.
+        :param forbidden (set): Forbidden key names for this resource.
+        :param recommended (set): Recommended key names for this resource.
+        :param known (set): Known key names for this resource, or None to
+            skip checking for unknown keys.
+        """
+        violations = _key_violations(r_dict.keys(), required, forbidden, known)
+        self._log_field_presence(resource, r_dict, violations, recommended)
+
+    def _log_field_presence(self, resource, r_dict, violations, recommended):
+        """Log the violations found by _key_violations for r_dict."""
+        present_forbidden, missing, unknown = violations
+        # Forbidden and unknown keys are logged in document order rather
+        # than in the (hash seeded) order of the sets they were found in.
+        if present_forbidden:
+            for key in r_dict:
+                if key in present_forbidden:
+                    self.log_error(key, "Key '{}' is not allowed in '{}'".format(key, resource))
+        for key in missing:
+            self.log_error(key, "Key '{}' is required in '{}'".format(key, resource))
+        for key in recommended:
+            if not r_dict.get(key):
+                self.log_warning(key, "{} SHOULD have {} field.".format(resource, key))
+        if unknown:
+            for key in r_dict:
+                if key in unknown:
+                    self.log_warning(key, "Unknown key '{}' in '{}'".format(key, resource))
+
     def _check_recommended_fields(self, resource, r_dict, fields):
         """Log warnings if fields which should be in r_dict are not.
 
@@ -325,9 +587,7 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         :param r_dict (dict): The dict that will have it's keys checked.
         :param fields (list): The keys to check for in r_dict.
         """
-        for f in fields:
-            if not r_dict.get(f):
-                self.log_warning(f, "{} SHOULD have {} field.".format(resource, f))
+        self._validate_field_presence(resource, r_dict, recommended=fields)
 
     def _check_unknown_fields(self, resource, r_dict, fields):
         """Log warnings if any fields which are not known in context are present.
@@ -336,9 +596,7 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         :param r_dict (dict): The dict to have its keys checked.
         :param fields (set): Known key names for this resource.
         """
-        for key in r_dict.keys():
-            if key not in fields:
-                self.log_warning(key, "Unknown key '{}' in '{}'".format(key, resource))
+        self._validate_field_presence(resource, r_dict, known=fields)
 
     def _check_forbidden_fields(self, resource, r_dict, fields):
         """Log warnings if keys which are forbidden in context are present.
@@ -347,20 +605,16 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         :param r_dict (dict): The dict to have its keys checked.
         :param fields (set): Forbidden key names for this resource.
         """
-        for key in r_dict.keys():
-            if key in fields:
-                self.log_error(key, "Key '{}' is not allowed in '{}'".format(key, resource))
+        self._validate_field_presence(resource, r_dict, forbidden=fields)
 
     def _check_required_fields(self, resource, r_dict, fields):
         """Log errors if the required fields are missing.
 
         :param resource (str): The name of the resource represented by r_dict.
         :param r_dict (dict): The dict to have its keys checked.
-        :param fields (set): Forbidden key names for this resource.
+        :param fields (set): Required key names for this resource.
         """
-        for f in fields:
-            if f not in r_dict:
-                self.log_error(f, "Key '{}' is required in '{}'".format(f, resource))
+        self._validate_field_presence(resource, r_dict, required=fields)
 
     def _check_all_key_constraints(self, resource, r_dict):
         """Call all key constraint checking methods."""
@@ -368,10 +622,13 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
             self.log_error(resource, "'{}' must be json-object, not {}".format(resource, type(r_dict).__name__))
             return r_dict
 
-        self._check_forbidden_fields(resource, r_dict, self.FORBIDDEN_FIELDS)
-        self._check_required_fields(resource, r_dict, self.REQUIRED_FIELDS)
-        self._check_recommended_fields(resource, r_dict, self.RECOMMENDED_FIELDS)
-        self._check_unknown_fields(resource, r_dict, self.KNOWN_FIELDS)
+        required, forbidden, known = self.REQUIRED_FIELDS, self.FORBIDDEN_FIELDS, self.KNOWN_FIELDS
+        if type(required) is frozenset and type(forbidden) is frozenset and type(known) is frozenset:
+            violations = _cached_key_violations(frozenset(r_dict), required, forbidden, known)
+        else:
+            # Constraints overridden with mutable sets can't be cached.
+            violations = _key_violations(r_dict.keys(), required, forbidden, known)
+        self._log_field_presence(resource, r_dict, violations, self.RECOMMENDED_FIELDS)
         return self._check_common_fields(r_dict)
 
     # Field definitions #
@@ -391,34 +648,59 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         self.log_error(field, "'{}' is not allowed here".format(field))
         return value
 
+    @staticmethod
+    def _repeated(fn, field, values):
+        """Apply fn to each of values, returning values itself if none were corrected.
+
+        Returning the original list lets _compare_dicts skip copying the
+        enclosing dict.
+        """
+        result = values
+        for i, val in enumerate(values):
+            new = fn(field, val)
+            if new is not val:
+                # Copy only once the first corrected element turns up.
+                if result is values:
+                    result = values[:]
+                result[i] = new
+        return result
+
     def _str_or_val_lang_type(self, field, value):
         """Check value is str or lang/val pairs, else raise ValidatorLogError.
 
         Allows for repeated strings as per 5.3.2.
         """
-        if isinstance(value, str):
+        if type(value) is str:
             # Check for invalid and forbidden html.
             self._check_html(field, value)
             return value
-        if isinstance(value, list):
-            return [self._str_or_val_lang_type(field, val) for val in value]
+        if type(value) is list:
+            return self._repeated(self._str_or_val_lang_type, field, value)
         if isinstance(value, dict):
             if "@value" not in value:
                 self.log_error(field, "Field has no '@value' key where one is required.")
                 return value
+            # Plain {'@value': str[, '@language': str]} pairs need no corrections,
+            # so only their html is checked.
+            if value.keys() <= self._VAL_LANG_KEYS and type(value["@value"]) is str \
+                    and type(value.get("@language", "")) is str:
+                if "@language" in value:
+                    self._check_html("@language", value["@language"])
+                self._check_html("@value", value["@value"])
+                return value
             return self._compare_dicts(self._LangValPairs, value)
         self.log_error(field, "Illegal type (should be str, list, or dict)")
         return value
 
     def _repeatable_string_type(self, field, value):
         """Allows for repeated strings as per 5.3.2."""
-        if isinstance(value, str):
+        if type(value) is str:
             # Check for invalid and forbidden html.
             self._check_html(field, value)
             return value
-        if isinstance(value, list):
+        if type(value) is list:
             for val in value:
-                if not isinstance(val, str):
+                if type(val) is not str:
                     self.log_error(field, "Overly nested strings: '{}'".format(value))
             return value
         self.log_error(field, "Got '{}' when expecting string or repeated string.".format(value))
@@ -427,8 +709,8 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
     def _repeatable_service_type(self, field, value):
         """ Allow for repeated service types, either referenced or embedded.
         """
-        if isinstance(value, list):
-            return [self._service_type(field, val) for val in value]
+        if type(value) is list:
+            return self._repeated(self._service_type, field, value)
         else:
             return self._service_type(field, value)
 
@@ -450,15 +732,25 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
                                     .format(field))
         return value
 
+    def _int_type(self, field, value):
+        """Check value is an int or raise ValidatorLogError.
+
+        Booleans are rejected, although bool subclasses int.
+        """
+        if type(value) is not int:
+            self.log_error(field, "{} must be int.".format(field))
+        return value
+
     def _repeatable_uri_type(self, field, value):
         """Allow single or repeating URIs.
 
         Based on 5.3.2 of Presentation API
         """
-        if isinstance(value, list):
-            return [self._uri_type(field, val) for val in value]
-        else:
-            return self._uri_type(field, value)
+        if type(value) is str:
+            return self._string_uri(field, value)
+        if type(value) is list:
+            return self._repeated(self._uri_type, field, value)
+        return self._uri_type(field, value)
 
     def _http_uri_type(self, field, value):
         """Allow single URI that MUST be http(s)
@@ -473,7 +765,7 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         Allows for multiple URI representations, as per 5.3.1 of the
         Presentation API.
         """
-        if isinstance(value, str):
+        if type(value) is str:
             return self._string_uri(field, value, http)
         elif isinstance(value, dict):
             emb_uri = value.get('@id')
@@ -493,22 +785,22 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         Should not actually be used in schema.
         """
         # Always raise invalid if the string field is not a string.
-        if not isinstance(value, str):
+        if type(value) is not str:
             self.log_error(field, "URI is not string: '{}'".format(value))
             return value
 
         # Check for invalid and forbidden html.
         self._check_html(field, value)
 
-        # Try to parse the url.
-        try:
-            pieces = urllib.parse.urlparse(value)
-        except AttributeError as a:
+        # Normalise the value as urllib.parse.urlparse does, then match
+        # the scheme and authority of the url.
+        uri = value.lstrip(_C0_CONTROL_OR_SPACE)
+        if '\t' in uri or '\r' in uri or '\n' in uri:
+            uri = uri.translate(_URL_CHARS_TO_REMOVE)
+        match = self._URI_REGEX.match(uri)
+        if not (match and match.group(2)):
             self.log_error(field, "URI is not valid: '{}'".format(value))
-            return value
-        if not all([pieces.scheme, pieces.netloc]):
-            self.log_error(field, "URI is not valid: '{}'".format(value))
-        if http and pieces.scheme not in ['http', 'https']:
+        if http and not (match and match.group(1).lower() in ('http', 'https')):
             self.log_error(field, "URI must be http: '{}'".format(value))
         return value
 
@@ -519,10 +811,9 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         Logs an error if any tag in HTML_FORBIDDEN_TAGS is present.
         Logs an error if any html tag is found in a field not in HTML_ALLOWED_FIELDS.
         """
-        # Disregarding indices in paths, check if the suffix of the current path
-        # is one which can validly contain html.
-        temp_path = self._path + field
-        field_allowed_html = any(temp_path.no_index_endswith(x) for x in self.HTML_ALLOWED_FIELDS)
+        # Tags, comments and CDATA all need a '<', and most values have none.
+        if '<' not in value:
+            return
 
         # Bool marking if this field contains valid xml markup.
         field_is_valid_xml = False
@@ -535,22 +826,25 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
             self.log_error(field, "If field contains HTML, it must start with character '<'.")
             return
 
-        # Error and exit if XML comments are detected.
-        field_contains_comments = bool(self._XML_COMMENT_REGEX.search(value))
-        if field_contains_comments:
-            self.log_error(field, "XML comments not allowed.")
-            return
-
-        # Error and exit if CDATA sections are detected.
-        field_contains_cdata = bool(self._XML_CDATA_REGEX.search(value))
-        if field_contains_cdata:
-            self.log_error(field, "CDATA sections not allowed.")
-            return
+        # Comments and CDATA sections both open with '<!', so values without
+        # one (nearly all html) skip both searches.
+        if '<!' in value:
+            # Error and exit if XML comments are detected.
+            field_contains_comments = bool(self._XML_COMMENT_REGEX.search(value))
+            if field_contains_comments:
+                self.log_error(field, "XML comments not allowed.")
+                return
+
+            # Error and exit if CDATA sections are detected.
+            field_contains_cdata = bool(self._XML_CDATA_REGEX.search(value))
+            if field_contains_cdata:
+                self.log_error(field, "CDATA sections not allowed.")
+                return
 
         # Try to parse the field and record if the field is valid xml.
         if field_contains_tags:
             try:
-                et = ET.fromstring(value)
+                et = _parse_html(value)
                 field_is_valid_xml = True
             except ET.ParseError:
                 field_is_valid_xml = False
@@ -559,6 +853,15 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         if not field_contains_tags:
             return
 
+        # Disregarding indices in paths, check if the suffix of the current path
+        # is one which can validly contain html.
+        temp_path = self._path + field
+        allowed_fields = self.HTML_ALLOWED_FIELDS
+        if type(allowed_fields) is not frozenset:
+            # Overridden on an instance with a mutable set or list.
+            allowed_fields = frozenset(tuple(suffix) for suffix in allowed_fields)
+        field_allowed_html = _html_allowed(allowed_fields, temp_path.no_index_path)
+
         # Log error and return if this field is not allowed to have HTML in it.
         if (field_is_valid_xml or field_contains_tags) and not field_allowed_html:
             self.log_error(field, "HTML not allowed in this field.")
@@ -569,46 +872,37 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
             self.log_error(field, "Field contains tags but is not valid HTML.")
             return
 
-        def check_html_element(elem):
-            """Recursively validate elements in etree."""
-            tag, attributes = elem.tag, elem.attrib.keys()
+        # Walk the tree in document order, stopping at the first error.
+        for elem in et.iter():
+            tag = elem.tag
 
-            # Log error and return if tag is forbidden.
+            # Log error and stop if tag is forbidden.
             if tag in self.HTML_FORBIDDEN_TAGS:
                 self.log_error(field, "Forbidden tag '<{}>' in html.".format(tag))
-                return False
+                return
 
-            # Log error and return if forbidden attributes are present.
-            allowed_attributes = self.HTML_ALLOWED_ATTRIBUTES.get(tag, set())
-            for attr in attributes:
+            # Log error and stop if forbidden attributes are present.
+            allowed_attributes = self.HTML_ALLOWED_ATTRIBUTES.get(tag, _EMPTY_SET)
+            for attr in elem.attrib.keys():
                 if attr not in allowed_attributes:
                     self.log_error(field, "HTML tag '<{}>' not allowed attribute '{}'.".format(tag, attr))
-                    return False
+                    return
 
             # Log warning if tag is not explicitly mentioned as being safe.
             if tag not in self.HTML_ALLOWED_TAGS:
                 self.log_warning(field, "HTML tag '<{}>' of uncertain validity "
                                         "(valid tags are <a>, <b>, <br>, <i>, <img>, <p>, and <span>)".format(tag))
 
-            for child_elem in elem:
-                child_valid = check_html_element(child_elem)
-                if not child_valid:
-                    return False
-            return True
-
-        check_html_element(et)
-
     # Common field definitions.
     def id_field(self, value):
         """Validate the ``@id`` field of the resource."""
         if value.startswith("urn:uuid:"):
-            id_uuid = value.replace("urn:uuid:", "")
-            try:
-                uuid.UUID(id_uuid)
-            except ValueError:
+            # Accepts the same spellings as uuid.UUID: optional braces and
+            # hyphens around 32 hex digits.
+            id_uuid = value[len("urn:uuid:"):].strip("{}").replace("-", "")
+            if not self._UUID_HEX_REGEX.fullmatch(id_uuid):
                 self.log_error("@id", "Invalid UUID in @id.")
-            finally:
-                return value
+            return value
         return self._http_uri_type("@id", value)
 
     def type_field(self, value):
@@ -653,30 +947,32 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
 
     def height_field(self, value):
         """Validate ``height`` field."""
-        if not isinstance(value, int):
-            self.log_error("height", "height must be int.")
-        return value
+        return self._int_type("height", value)
 
     def width_field(self, value):
         """Validate ``width`` field."""
-        if not isinstance(value, int):
-            self.log_error("width", "width must be int.")
-        return value
+        return self._int_type("width", value)
 
     def metadata_field(self, value):
         """Validate the `metadata` field of the resource.
 
         Recurse into keys/values and checks that they are properly formatted.
         """
-        if not isinstance(value, list):
+        if type(value) is not list:
             self.log_error("metadata", "Metadata MUST be a list")
             return value
 
         result = []
-        with self._temp_path(self._path + ("metadata",)):
+        old_path = self._path
+        path = old_path + "metadata"
+        # Step the path along the entries directly rather than entering
+        # a _temp_path context for each one.
+        try:
             for i, m in enumerate(value):
-                with self._temp_path(self._path + i):
-                    result.append(self._metadata_entry(m))
+                self._path = path + i
+                result.append(self._metadata_entry(m))
+        finally:
+            self._path = old_path
         return result
 
     def _metadata_entry(self, value):
@@ -690,9 +986,10 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
             self.log_error("value", "metadata entries must have values")
             return value
         else:
+            # Both keys were just checked for, so index them directly.
             return {
-                'label': self._str_or_val_lang_type("label", value.get("label")),
-                'value': self._str_or_val_lang_type("value", value.get("value"))
+                'label': self._str_or_val_lang_type("label", value["label"]),
+                'value': self._str_or_val_lang_type("value", value["value"])
             }
 
     def thumbnail_field(self, value):
@@ -711,12 +1008,13 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
         -Otherwise, check that it's ID is at least a uri.
         """
 
-        if isinstance(value, str):
+        if type(value) is str:
             self.log_warning(field, "{} SHOULD be IIIF image service.".format(field))
-            return self._uri_type(field, value)
+            # Already known to be a str, so skip _uri_type's dispatch.
+            return self._string_uri(field, value)
         if isinstance(value, dict):
             service = value.get("service")
-            if service and service.get("@context") == "http://iiif.io/api/image/2/context.json":
+            if isinstance(service, dict) and service.get("@context") == self.IMAGE_API_2:
                 value['service'] = self.ImageContentValidator.service_field(service)
                 return value
             else:
@@ -728,7 +1026,8 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
 
     def viewing_hint_field(self, value):
         """Validate ``viewingHint`` field against ``VIEW_HINTS`` set."""
-        if value not in self.VIEW_HINTS:
+        # Only strings can be hints; lists and dicts are not hashable.
+        if type(value) is not str or value not in self.VIEW_HINTS:
             val, errors = self.mute_errors(self._uri_type, "viewingHint", value)
             if errors:
                 self.log_error("viewingHint", "viewingHint '{}' is not valid and not uri.".format(value))
@@ -736,6 +1035,6 @@ class BaseValidator(LinkedValidatorMixin, SubValidationMixin):
 
     def viewing_dir_field(self, value):
         """Validate ``viewingDir`` field against ``VIEW_DIRS`` set."""
-        if value not in self.VIEW_DIRS:
+        if type(value) is not str or value not in self.VIEW_DIRS:
             self.log_error("viewingDirection", "viewingDirection '{}' is not valid and not uri.".format(value))
         return value
@@ -18,31 +18,32 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from collections import OrderedDict
-
 from .base_validator import BaseValidator
 
 
 class CanvasValidator(BaseValidator):
-    VIEW_HINTS = {'non-paged', 'facing-pages'}
+    VIEW_HINTS = frozenset({'non-paged', 'facing-pages'})
 
     KNOWN_FIELDS = BaseValidator.COMMON_FIELDS | {"height", "width", "otherContent", "images"}
-    FORBIDDEN_FIELDS = {"format", "viewingDirection", "navDate", "startCanvas", "first", "last", "total",
-                        "next", "prev", "startIndex", "collections", "manifests", "members", "sequences",
-                        "structures", "canvases", "resources", "ranges"}
-    REQUIRED_FIELDS = {"label", "@id", "@type", "height", "width"}
+    FORBIDDEN_FIELDS = frozenset({"format", "viewingDirection", "navDate", "startCanvas", "first", "last", "total",
+                                  "next", "prev", "startIndex", "collections", "manifests", "members", "sequences",
+                                  "structures", "canvases", "resources", "ranges"})
+    REQUIRED_FIELDS = frozenset({"label", "@id", "@type", "height", "width"})
+
+    # (key, method name) pairs checked on each canvas, in order.
+    _CANVAS_SCHEMA = (
+        ('@id', 'id_field'),
+        ('@type', 'type_field'),
+        ('label', 'label_field'),
+        ('height', 'height_field'),
+        ('width', 'width_field'),
+        ('other_content', 'other_content_field'),
+        ('images', 'images_field')
+    )
 
     def __init__(self, iiif_validator):
         super().__init__(iiif_validator)
-        self.CanvasSchema = OrderedDict((
-            ('@id', self.id_field),
-            ('@type', self.type_field),
-            ('label', self.label_field),
-            ('height', self.height_field),
-            ('width', self.width_field),
-            ('other_content', self.other_content_field),
-            ('images', self.images_field)
-        ))
+        self.CanvasSchema = self._bind_schema(self._CANVAS_SCHEMA)
         self.setup()
 
     def _run_validation(self, **kwargs):
@@ -66,11 +67,11 @@ class CanvasValidator(BaseValidator):
 
         Calls a sub-validation procedure handled by the :class:`AnnotationValidator`.
         """
-        if not value or not isinstance(value, list):
+        if not value or type(value) is not list:
             self.log_error("images", "'images' MUST be a list.")
             return value
 
-        path = self._path + ("images",)
+        path = self._path + "images"
         results = []
         for i, anno in enumerate(value):
             temp_path = path + i
@@ -80,7 +81,9 @@ class CanvasValidator(BaseValidator):
 
     def other_content_field(self, value):
         """Validate ``otherContent`` field."""
-        if not isinstance(value, list):
+        if type(value) is not list:
             self.log_error("otherContent", "otherContent must be a list.")
             return value
-        return [self._uri_type("otherContent", item['@id']) for item in value]
+        for item in value:
+            self._uri_type("otherContent", item['@id'])
+        return value
@@ -18,28 +18,29 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from collections import OrderedDict
-
 from .base_validator import BaseValidator
 
 
 class ImageContentValidator(BaseValidator):
     KNOWN_FIELDS = BaseValidator.COMMON_FIELDS | {"@context", "height", "width", "format"}
-    FORBIDDEN_FIELDS = {"viewingDirection", "navDate", "startCanvas", "first", "last", "total",
-                        "next", "prev", "startIndex", "collections", "manifests", "members",
-                        "sequences", "structures", "canvases", "resources", "otherContent",
-                        "images", "ranges"}
-    REQUIRED_FIELDS = {'@type', '@id'}
+    FORBIDDEN_FIELDS = frozenset({"viewingDirection", "navDate", "startCanvas", "first", "last", "total",
+                                  "next", "prev", "startIndex", "collections", "manifests", "members",
+                                  "sequences", "structures", "canvases", "resources", "otherContent",
+                                  "images", "ranges"})
+    REQUIRED_FIELDS = frozenset({'@type', '@id'})
+
+    # (key, method name) pairs checked on each image resource, in order.
+    _IMAGE_CONTENT_SCHEMA = (
+        ('@id', 'id_field'),
+        ('@type', 'type_field'),
+        ('height', 'height_field'),
+        ('width', 'width_field'),
+        ('service', 'service_field')
+    )
 
     def __init__(self, iiif_validator):
         super().__init__(iiif_validator)
-        self.ImageContentSchema = OrderedDict((
-            ('@id', self.id_field),
-            ('@type', self.type_field),
-            ('height', self.height_field),
-            ('width', self.width_field),
-            ('service', self.service_field)
-        ))
+        self.ImageContentSchema = self._bind_schema(self._IMAGE_CONTENT_SCHEMA)
         self.setup()
 
     def _run_validation(self, **kwargs):
@@ -54,7 +55,7 @@ class ImageContentValidator(BaseValidator):
 
     def service_field(self, value):
         """Validate the image service in this resource."""
-        with self._temp_path(self._path + ('service',)):
+        with self._temp_path(self._path + "service"):
             self._check_required_fields("image service", value, ['@id', '@context'])
             self._check_recommended_fields("image service", value, ['profile'])
             context = value.get("@context")
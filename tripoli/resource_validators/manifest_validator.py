@@ -18,31 +18,32 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from collections import OrderedDict
-
 from .base_validator import BaseValidator
 
 
 class ManifestValidator(BaseValidator):
-    VIEW_DIRS = ['left-to-right', 'right-to-left',
-                 'top-to-bottom', 'bottom-to-top']
-    VIEW_HINTS = ['individuals', 'paged', 'continuous']
+    VIEW_DIRS = frozenset({'left-to-right', 'right-to-left',
+                           'top-to-bottom', 'bottom-to-top'})
+    VIEW_HINTS = frozenset({'individuals', 'paged', 'continuous'})
 
     KNOWN_FIELDS = BaseValidator.COMMON_FIELDS | {"viewingDirection", "navDate", "sequences", "structures", "@context"}
-    FORBIDDEN_FIELDS = {"format", "height", "width", "startCanvas", "first", "last", "total", "next", "prev",
-                        "startIndex", "collections", "manifests", "members", "canvases", "resources", "otherContent",
-                        "images", "ranges"}
-    REQUIRED_FIELDS = {"label", "@context", "@id", "@type", "sequences"}
-    RECOMMENDED_FIELDS = {"metadata", "description", "thumbnail"}
+    FORBIDDEN_FIELDS = frozenset({"format", "height", "width", "startCanvas", "first", "last", "total", "next",
+                                  "prev", "startIndex", "collections", "manifests", "members", "canvases",
+                                  "resources", "otherContent", "images", "ranges"})
+    REQUIRED_FIELDS = frozenset({"label", "@context", "@id", "@type", "sequences"})
+    RECOMMENDED_FIELDS = frozenset({"metadata", "description", "thumbnail"})
+
+    # (key, method name) pairs checked on each manifest, in order.
+    _MANIFEST_SCHEMA = (
+        ('@context', 'context_field'),
+        ('structures', 'structures_field'),
+        ('sequences', 'sequences_field'),
+        ('viewingDirection', 'viewing_dir_field'),
+    )
 
     def __init__(self, iiif_validator):
         super().__init__(iiif_validator)
-        self.ManifestSchema = OrderedDict((
-            ('@context', self.context_field),
-            ('structures', self.structures_field),
-            ('sequences', self.sequences_field),
-            ('viewingDirection', self.viewing_dir_field),
-        ))
+        self.ManifestSchema = self._bind_schema(self._MANIFEST_SCHEMA)
         self.setup()
 
     def _run_validation(self, **kwargs):
@@ -57,10 +58,10 @@ class ManifestValidator(BaseValidator):
 
     def context_field(self, value):
         """Assert that ``@context`` is the IIIF 2.0 presentation API."""
-        if isinstance(value, str):
+        if type(value) is str:
             if not value == self.PRESENTATION_API_URI:
                 self.log_error("@context", "'@context' must be set to '{}'".format(self.PRESENTATION_API_URI))
-        if isinstance(value, list):
+        if type(value) is list:
             if self.PRESENTATION_API_URI not in value:
                 self.log_error("@context", "'@context' must be set to '{}'".format(self.PRESENTATION_API_URI))
         return value
@@ -74,7 +75,7 @@ class ManifestValidator(BaseValidator):
 
         Checks that at least 1 sequence is embedded.
         """
-        if not isinstance(value, list):
+        if type(value) is not list:
             self.log_error("sequences", "'sequences' MUST be a list")
             return value
 
@@ -82,12 +83,7 @@ class ManifestValidator(BaseValidator):
             self.log_error("sequences", "Manifest requires at least one sequence")
             return value
 
-        results = []
-        path = self._path + ("sequences",)
-        for i, seq in enumerate(value):
-            temp_path = path + i
-            if i == 0:
-                results.append(self._sub_validate(self.SequenceValidator, seq, temp_path, emb=True))
-            else:
-                results.append(self._sub_validate(self.SequenceValidator, seq, temp_path, emb=False))
-        return results
+        # Only the first sequence is embedded in the manifest.
+        path = self._path + "sequences"
+        return [self._sub_validate(self.SequenceValidator, seq, path + i, emb=(i == 0))
+                for i, seq in enumerate(value)]
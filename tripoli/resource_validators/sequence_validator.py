@@ -18,39 +18,42 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-from collections import OrderedDict
-
 from .base_validator import BaseValidator
 
 
 class SequenceValidator(BaseValidator):
-    VIEW_DIRS = {'left-to-right', 'right-to-left',
-                 'top-to-bottom', 'bottom-to-top'}
-    VIEW_HINTS = {'individuals', 'paged', 'continuous'}
+    VIEW_DIRS = frozenset({'left-to-right', 'right-to-left',
+                           'top-to-bottom', 'bottom-to-top'})
+    VIEW_HINTS = frozenset({'individuals', 'paged', 'continuous'})
 
     KNOWN_FIELDS = BaseValidator.COMMON_FIELDS | {"viewingDirection", "startCanvas", "canvases"}
-    FORBIDDEN_FIELDS = {"format", "height", "width", "navDate", "first", "last", "total", "next", "prev",
-                        "startIndex", "collections", "manifests", "sequences", "structures", "resources",
-                        "otherContent", "images", "ranges"}
-    REQUIRED_FIELDS = {"@type", "canvases"}
+    FORBIDDEN_FIELDS = frozenset({"format", "height", "width", "navDate", "first", "last", "total", "next", "prev",
+                                  "startIndex", "collections", "manifests", "sequences", "structures", "resources",
+                                  "otherContent", "images", "ranges"})
+    REQUIRED_FIELDS = frozenset({"@type", "canvases"})
+
+    # (key, method name) pairs checked on each embedded sequence, in order.
+    _EMB_SEQUENCE_SCHEMA = (
+        ('@type', 'type_field'),
+        ('@context', 'context_field'),
+        ('@id', 'id_field'),
+        ('startCanvas', 'startCanvas_field'),
+        ('viewingDirection', 'viewing_dir_field'),
+        ('canvases', 'canvases_field'),
+    )
+
+    # (key, method name) pairs checked on each linked sequence, in order.
+    _LINKED_SEQUENCE_SCHEMA = (
+        ('@type', 'type_field'),
+        ('@id', 'id_field'),
+        ('canvases', '_canvas_not_allowed')
+    )
 
     def __init__(self, iiif_validator):
         super().__init__(iiif_validator)
         self.emb = None
-        self.EmbSequenceSchema = OrderedDict((
-            ('@type', self.type_field),
-            ('@context', self.context_field),
-            ('@id', self.id_field),
-            ('startCanvas', self.startCanvas_field),
-            ('viewingDirection', self.viewing_dir_field),
-            ('canvases', self.canvases_field),
-        ))
-
-        self.LinkedSequenceSchema = OrderedDict((
-            ('@type', self.type_field),
-            ('@id', self.id_field),
-            ('canvases', self._canvas_not_allowed)
-        ))
+        self.EmbSequenceSchema = self._bind_schema(self._EMB_SEQUENCE_SCHEMA)
+        self.LinkedSequenceSchema = self._bind_schema(self._LINKED_SEQUENCE_SCHEMA)
         self.setup()
 
     def _run_validation(self, **kwargs):
@@ -99,7 +102,7 @@ class SequenceValidator(BaseValidator):
 
     def canvases_field(self, value):
         """Validate ``canvases`` list for Sequence."""
-        if not isinstance(value, list):
+        if type(value) is not list:
             self.log_error("canvases", "'canvases' MUST be a list.")
             return value
 
@@ -107,7 +110,7 @@ class SequenceValidator(BaseValidator):
             self.log_error("canvases", "'canvases' MUST have at least one entry")
             return value
 
-        path = self._path + ("canvases",)
+        path = self._path + "canvases"
         results = []
 
         for i, canvas in enumerate(value):
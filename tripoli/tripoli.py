@@ -21,6 +21,11 @@
 import json
 import logging
 
+try:
+    from orjson import loads as _fast_json_loads
+except ImportError:
+    _fast_json_loads = None
+
 from .exceptions import FailFastException, TypeParseException
 from .mixins import SubValidationMixin
 from .validator_logging import ValidatorLogError, ValidatorLog, Path
@@ -31,6 +36,21 @@ from .resource_validators import (
 __version__ = "2.0.0"
 
 
+def json_loads(s):
+    """Parse a JSON document, using orjson when it is installed.
+
+    Documents orjson rejects (NaN, integers beyond 64 bits, lone
+    surrogates) are retried with the standard library, so which documents
+    parse does not depend on what is installed.
+    """
+    if _fast_json_loads is not None:
+        try:
+            return _fast_json_loads(s)
+        except ValueError:
+            pass
+    return json.loads(s)
+
+
 class IIIFValidator(SubValidationMixin):
     #: Sets whether or not to save tracebacks in warnings/errors.
     debug = False
@@ -175,7 +195,7 @@ class IIIFValidator(SubValidationMixin):
     def _parse_json(self, json_dict):
         if isinstance(json_dict, str):
             try:
-                json_dict = json.loads(json_dict)
+                json_dict = json_loads(json_dict)
             except ValueError:
                 self._exit_early("Could not parse json.")
         return json_dict
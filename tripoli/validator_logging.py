@@ -18,56 +18,60 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
+import sys
 import traceback
+from collections import OrderedDict
 from itertools import zip_longest
 
 
-class Path:
-    """Class representing path within document."""
-    def __init__(self, path=None):
+def _intern(segment):
+    """Intern a path segment if it is a plain string."""
+    return sys.intern(segment) if type(segment) is str else segment
+
+
+class Path(tuple):
+    """Class representing path within document.
+
+    Paths are tuples of strings and ints, so hashing, equality and
+    concatenation are all done by the underlying tuple.
+    """
+    __slots__ = ()
+
+    def __new__(cls, path=None):
         """ Create a Path.
 
+        Key names are interned so that comparing paths built from
+        different documents can short-circuit on identity.
+
         :param path: Tuple of strings and ints.
         """
-        self._path = path if path is not None else tuple()
-        self.__no_index_path = None
-
-    def __eq__(self, other):
-        return self.__no_index_path == other.__no_index_path
-
-    def __len__(self):
-        return len(self._path)
+        if not path:
+            return tuple.__new__(cls)
+        return tuple.__new__(cls, [_intern(x) for x in path])
 
     def __str__(self):
-        return ' @ data[%s]' % ']['.join(map(repr, self._path)) if self._path else ''
+        return ' @ data[%s]' % ']['.join(map(repr, self)) if self else ''
 
     def __repr__(self):
-        return 'Path({})'.format(", ".join(repr(x) for x in self._path))
-
-    def __iter__(self):
-        return self._path.__iter__()
+        return 'Path({})'.format(", ".join(repr(x) for x in self))
 
     def __add__(self, other):
+        # Only the new segments need interning; self already is.
         if isinstance(other, (str, int)):
-            return Path(self._path + (other,))
-        if isinstance(other, tuple):
-            return Path(self._path + other)
+            return tuple.__new__(Path, tuple.__add__(self, (_intern(other),)))
         if isinstance(other, Path):
-            return Path(self._path + other._path)
+            return tuple.__new__(Path, tuple.__add__(self, other))
+        if isinstance(other, tuple):
+            return tuple.__new__(Path, tuple.__add__(self, tuple(_intern(x) for x in other)))
         return NotImplemented
 
-    def __hash__(self):
-        return hash(self._path)
-
     @property
     def no_index_path(self):
-        if self.__no_index_path is None:
-            self.__no_index_path = tuple(filter(lambda x: isinstance(x, str), self._path))
-        return self.__no_index_path
+        return tuple(x for x in self if type(x) is str)
 
     @property
     def path(self):
-        return self._path
+        return tuple(self)
 
     def no_index_eq(self, other):
         """Return true if paths are the same, ignoring indexes.
@@ -88,41 +92,54 @@ class Path:
 
 
 class ValidatorLog:
-    """Log which provides unified interface for either set or list like behaviour."""
+    """Log which provides unified interface for either set or list like behaviour.
+
+    When ``unique_logging`` is set, entries are kept in an OrderedDict
+    keyed by the entries themselves (which hash and compare by type,
+    message and index-less path), so duplicates are dropped in constant
+    time while the order entries were logged in is preserved.
+    """
     def __init__(self, unique_logging=True):
         self.unique_logging = unique_logging
-        self._entries = set() if unique_logging else []
+        self._entries = OrderedDict() if unique_logging else []
 
     def add(self, log_entry):
         """Add an entry to the log.
 
         :param log_entry: A ValidatorLogEntry to add to self.
         """
-        if isinstance(log_entry, ValidatorLogEntry):
-            if self.unique_logging:
-                self._entries.add(log_entry)
-            else:
-                self._entries.append(log_entry)
-        else:
+        if not isinstance(log_entry, ValidatorLogEntry):
             raise TypeError('log_entry must be a ValidatorLogEntry')
+        if self.unique_logging:
+            # setdefault keeps the first of any equal entries.
+            self._entries.setdefault(log_entry, log_entry)
+        else:
+            self._entries.append(log_entry)
 
     def update(self, log_entry):
         """Add all entries from log_entry to self.
 
         :param log_entry: A ValidatorLog to update from.
         """
-        for entry in log_entry._entries:
-            self.add(entry)
+        add = self.add
+        for entry in log_entry:
+            add(entry)
 
     def __iter__(self):
+        if self.unique_logging:
+            return iter(self._entries.values())
         return iter(self._entries)
 
+    def __len__(self):
+        return len(self._entries)
+
     def __bool__(self):
         return bool(self._entries)
 
 
 class ValidatorLogEntry:
     """Basic error logging class with comparison behavior for hashing."""
+    __slots__ = ('msg', 'path', '_tb', '_path_str', '_log_str', '_hash')
 
     def __init__(self, msg, path, tb=None):
         """
@@ -136,37 +153,60 @@ class ValidatorLogEntry:
         self.msg = msg
 
         #: A tuple representing the path where the entry was created.
-        self.path = Path(path)
+        self.path = path if type(path) is Path else Path(path)
+
+        # Only captured in debug mode; None otherwise.
+        self._tb = tb
+
+        # Formatted lazily by path_str() and log_str(), as most entries
+        # are never printed.
+        self._path_str = None
+        self._log_str = None
 
-        self._tb = tb if tb else []
+        # Computed lazily by __hash__; entries are not modified once logged.
+        self._hash = None
 
     def print_trace(self):
         """Print the stored traceback if it exists."""
-        traceback.print_list(self._tb)
+        if self._tb:
+            traceback.print_list(self._tb)
 
     def path_str(self):
-        return str(self.path)
+        path_str = self._path_str
+        if path_str is None:
+            path_str = self._path_str = str(self.path)
+        return path_str
 
     def log_str(self):
-        return self.msg + self.path_str()
+        log_str = self._log_str
+        if log_str is None:
+            log_str = self._log_str = self.msg + self.path_str()
+        return log_str
 
     def __lt__(self, other):
         return len(self.path) < len(other.path)
 
     def __hash__(self):
-        return hash(self.path.no_index_path) ^ hash(self.msg)
+        # Hashed from the fields themselves; the formatted string is only
+        # ever built for output.
+        h = self._hash
+        if h is None:
+            h = self._hash = hash((type(self), self.msg, self.path.no_index_path))
+        return h
 
     def __eq__(self, other):
-        return self.path.no_index_path == other.path.no_index_path\
-                and self.msg == other.msg
+        if self is other:
+            return True
+        return type(self) is type(other) and self.msg == other.msg\
+            and self.path.no_index_path == other.path.no_index_path
 
 
 class ValidatorLogWarning(ValidatorLogEntry):
     """Class to hold and present warnings."""
+    __slots__ = ()
 
     def __str__(self):
-        output = "Warning: {}".format(self.msg)
-        return output + self.path_str()
+        return "Warning: " + self.log_str()
 
     def __repr__(self):
         return "ValidatorLogWarning('{}', {})".format(self.msg, self.path)
@@ -174,10 +214,10 @@ class ValidatorLogWarning(ValidatorLogEntry):
 
 class ValidatorLogError(ValidatorLogEntry):
     """Class to hold and present errors."""
+    __slots__ = ()
 
     def __str__(self):
-        output = "Error: {}".format(self.msg)
-        return output + self.path_str()
+        return "Error: " + self.log_str()
 
     def __repr__(self):
         return "ValidatorLogError('{}', {})".format(self.msg, self.path)